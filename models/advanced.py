@@ -1,8 +1,6 @@
-import json
 import pandas as pd
-from sklearn.decomposition import TruncatedSVD
-from sklearn.cluster import KMeans
 from preprocessors import preprocessors
+from models.advanced_recommender import Recommender, from_files
 
 """
     Advanced recommender generates predictions based on similar user groups.
@@ -23,54 +21,6 @@ K_MEANS_N_INIT = 50
 K_MEANS_N_CLUSTERS = 8
 
 
-class Recommender:
-
-    def __init__(self, user_to_group: dict, group_recommendations: dict):
-        """
-        Constructs advanced recommender based on recommendation dictionaries.
-
-        Dictionaries MUST contain all user_ids present in the system and
-        all category paths specified for the products.
-
-        :param user_to_group: dictionary containing mapping user_id -> group_id.
-        :param group_recommendations:  dictionary containing mapping group_id -> category_path -> list of products.
-        """
-        self.user_to_group = user_to_group
-        self.group_recommendations = group_recommendations
-
-    def recommend(self, user_id: int, category: str) -> list:
-        """
-        Generates recommendation for the user.
-
-        :param user_id: id of the user for which the recommendation will be generated.
-        :param category: name of the currently browsing category.
-        :return: list of products recommended to the user.
-        """
-        return self.group_recommendations[self.user_to_group[user_id]][category]
-
-    def dump(self, user_to_group_fp: str, group_recommendations_fp: str):
-        """
-        Saves advanced model into two files for convenience with reading.
-
-        In order to reduce it into single file, same clever function is needed
-        to distinguish between 2 dictionaries.
-
-        :param user_to_group_fp: file path to store user_to_group dictionary in.
-        :param group_recommendations_fp: file path to store group_recommendations dictionary in.
-        """
-        with (open(user_to_group_fp, 'w')) as file:
-            json.dump(self.user_to_group, file, sort_keys=True, indent=4)
-        with open(group_recommendations_fp, 'w') as file:
-            json.dump(self.group_recommendations, file, sort_keys=True, indent=4)
-
-    @staticmethod
-    def name():
-        """
-        Function returns the name of the recommender.
-        """
-        return "Advanced"
-
-
 #####################################################################
 # Code below is associated with building the advanced recommender.  #
 #####################################################################
@@ -140,6 +90,8 @@ def _construct_interaction_matrix(training_set: pd.DataFrame) -> pd.DataFrame:
 
 
 def _reduce_dimensionality(interaction_matrix: pd.DataFrame) -> pd.DataFrame:
+    # Scikit-learn is imported lazily, as it is needed only while building the model.
+    from sklearn.decomposition import TruncatedSVD
     svd = TruncatedSVD(
         n_components=PRODUCTS_SPACE_DIMENSION,
         n_iter=SVD_ITER_AMOUNT
@@ -151,6 +103,7 @@ def _reduce_dimensionality(interaction_matrix: pd.DataFrame) -> pd.DataFrame:
 
 
 def _perform_grouping(interaction_matrix: pd.DataFrame) -> pd.DataFrame:
+    from sklearn.cluster import KMeans
     k_means = KMeans(
         n_clusters=K_MEANS_N_CLUSTERS,
         n_init=K_MEANS_N_INIT
@@ -201,30 +154,6 @@ def build(
     )
 
 
-def from_files(
-        user_to_group_fp: str,
-        group_recommendations_fp: str
-        ) -> Recommender:
-    """
-    Function constructs advanced recommender from files provided.
-
-    Files should contain dictionaries used during predictions (created with Recommender.dump()).
-
-    :param user_to_group_fp: file path pointing to stored user_to_group dictionary data
-    :param group_recommendations_fp: file path pointing to stored group_recommendations dictionary data.
-    :return: Recommender constructed from files.
-    """
-    with (open(user_to_group_fp, 'r')) as file:
-        user_to_group = json.load(file)
-    with open(group_recommendations_fp, 'r') as file:
-        group_recommendations = json.load(file)
-
-    return Recommender(
-        user_to_group={int(key): value for key, value in user_to_group.items()},
-        group_recommendations={int(key): value for key, value in group_recommendations.items()}
-    )
-
-
 if __name__ == '__main__':
     sessionsDataPath = '../notebooks/data/v2/sessions.jsonl'
     productsDataPath = '../notebooks/data/v2/products.jsonl'
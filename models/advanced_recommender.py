@@ -0,0 +1,89 @@
+import json
+
+"""
+    Serving part of the advanced model (see advanced.py for the way it is built).
+
+    Module depends only on the standard library, so it is cheap to import in the service.
+"""
+
+
+class Recommender:
+
+    def __init__(self, user_to_group: dict, group_recommendations: dict):
+        """
+        Constructs advanced recommender based on recommendation dictionaries.
+
+        Dictionaries MUST contain all user_ids present in the system and
+        all category paths specified for the products.
+
+        :param user_to_group: dictionary containing mapping user_id -> group_id.
+        :param group_recommendations:  dictionary containing mapping group_id -> category_path -> list of products.
+        """
+        self.user_to_group = user_to_group
+        self.group_recommendations = group_recommendations
+
+    def recommend(self, user_id: int, category: str) -> list:
+        """
+        Generates recommendation for the user.
+
+        :param user_id: id of the user for which the recommendation will be generated.
+        :param category: name of the currently browsing category.
+        :return: list of products recommended to the user.
+        """
+        return self.recommend_for_group(self.user_to_group[user_id], category)
+
+    def recommend_for_group(self, group_id: int, category: str) -> list:
+        """
+        Generates recommendation for the whole group of users.
+
+        :param group_id: id of the group for which the recommendation will be generated.
+        :param category: name of the currently browsing category.
+        :return: list of products recommended to the group.
+        """
+        return self.group_recommendations[group_id][category]
+
+    def dump(self, user_to_group_fp: str, group_recommendations_fp: str):
+        """
+        Saves advanced model into two files for convenience with reading.
+
+        In order to reduce it into single file, same clever function is needed
+        to distinguish between 2 dictionaries.
+
+        :param user_to_group_fp: file path to store user_to_group dictionary in.
+        :param group_recommendations_fp: file path to store group_recommendations dictionary in.
+        """
+        with (open(user_to_group_fp, 'w')) as file:
+            json.dump(self.user_to_group, file, sort_keys=True, indent=4)
+        with open(group_recommendations_fp, 'w') as file:
+            json.dump(self.group_recommendations, file, sort_keys=True, indent=4)
+
+    @staticmethod
+    def name():
+        """
+        Function returns the name of the recommender.
+        """
+        return "Advanced"
+
+
+def from_files(
+        user_to_group_fp: str,
+        group_recommendations_fp: str
+        ) -> Recommender:
+    """
+    Function constructs advanced recommender from files provided.
+
+    Files should contain dictionaries used during predictions (created with Recommender.dump()).
+
+    :param user_to_group_fp: file path pointing to stored user_to_group dictionary data
+    :param group_recommendations_fp: file path pointing to stored group_recommendations dictionary data.
+    :return: Recommender constructed from files.
+    """
+    with (open(user_to_group_fp, 'r')) as file:
+        user_to_group = json.load(file)
+    with open(group_recommendations_fp, 'r') as file:
+        group_recommendations = json.load(file)
+
+    return Recommender(
+        user_to_group={int(key): value for key, value in user_to_group.items()},
+        group_recommendations={int(key): value for key, value in group_recommendations.items()}
+    )
@@ -1,7 +1,7 @@
-import json
 import pandas as pd
 import numpy as np
 from preprocessors import preprocessors
+from models.basic_recommender import Recommender, from_file
 
 """
     Basic model creates predictions based on score assigned to each product.
@@ -13,46 +13,6 @@ from preprocessors import preprocessors
 """
 
 
-class Recommender:
-
-    def __init__(self, recommendations: list):
-        """
-        Constructs basic Recommender based on recommendation list.
-
-        Recommendations list should contain BEST products from the whole store.
-        The way it is calculated is left to the provider.
-
-        :param recommendations: list containing the best products.
-        """
-        self.recommendations = recommendations
-
-    def recommend(self, user_id: int, category: str) -> list:
-        """
-        Generates recommendation for the user.
-
-        :param user_id: this parameter is not used.
-        :param category: this parameter is not used.
-        :return: list of products recommended to the user.
-        """
-        return self.recommendations
-
-    def dump(self, recommendations_fp: str):
-        """
-        Saves basic model into file.
-
-        :param recommendations_fp: file path to store recommendations list in.
-        """
-        with (open(recommendations_fp, 'w')) as file:
-            json.dump(self.recommendations, file)
-
-    @staticmethod
-    def name():
-        """
-        Function returns the name of the recommender.
-        """
-        return "Basic"
-
-
 ################################################################
 #  Code below is associated with building basic Recommender.   #
 ################################################################
@@ -111,20 +71,6 @@ def build(sessions_df: pd.DataFrame, products_df: pd.DataFrame) -> Recommender:
     )
 
 
-def from_file(recommendations_fp: str) -> Recommender:
-    """
-    Function restores basic Recommender from file.
-
-    :param recommendations_fp: file containing recommendations for basic Recommender (created with Recommender.dump())
-    :return: basic Recommender constructed from data in file.
-    """
-    with open(recommendations_fp, 'r') as file:
-        recommendations = json.load(file)
-    return Recommender(
-        recommendations=recommendations
-    )
-
-
 if __name__ == "__main__":
     productsDataPath = '../notebooks/data/v2/products.jsonl'
     sessionsDataPath = '../notebooks/data/v2/sessions.jsonl'
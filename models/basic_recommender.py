@@ -0,0 +1,61 @@
+import json
+
+"""
+    Serving part of the basic model (see basic.py for the way it is built).
+
+    Module depends only on the standard library, so it is cheap to import in the service.
+"""
+
+
+class Recommender:
+
+    def __init__(self, recommendations: list):
+        """
+        Constructs basic Recommender based on recommendation list.
+
+        Recommendations list should contain BEST products from the whole store.
+        The way it is calculated is left to the provider.
+
+        :param recommendations: list containing the best products.
+        """
+        self.recommendations = recommendations
+
+    def recommend(self, user_id: int, category: str) -> list:
+        """
+        Generates recommendation for the user.
+
+        :param user_id: this parameter is not used.
+        :param category: this parameter is not used.
+        :return: list of products recommended to the user.
+        """
+        return self.recommendations
+
+    def dump(self, recommendations_fp: str):
+        """
+        Saves basic model into file.
+
+        :param recommendations_fp: file path to store recommendations list in.
+        """
+        with (open(recommendations_fp, 'w')) as file:
+            json.dump(self.recommendations, file)
+
+    @staticmethod
+    def name():
+        """
+        Function returns the name of the recommender.
+        """
+        return "Basic"
+
+
+def from_file(recommendations_fp: str) -> Recommender:
+    """
+    Function restores basic Recommender from file.
+
+    :param recommendations_fp: file containing recommendations for basic Recommender (created with Recommender.dump())
+    :return: basic Recommender constructed from data in file.
+    """
+    with open(recommendations_fp, 'r') as file:
+        recommendations = json.load(file)
+    return Recommender(
+        recommendations=recommendations
+    )
@@ -0,0 +1,100 @@
+import pandas as pd
+from preprocessors import preprocessors
+from models.session_recommender import NEIGHBOURS_COUNT, Recommender, from_file
+
+"""
+    Session model re-ranks recommendations based on what user did in the current session.
+
+    Model itself is an item-to-item co-occurrence index. Two products co-occur,
+    when they were interacted with within the same session.
+    For each product, top n co-occurring products from each category are stored
+    (ordered by the amount of sessions in which both products were present).
+
+    During serving, products recently seen in the session are used to pull
+    their neighbours to the front of the list served by another recommender
+    (ex. the advanced one).
+"""
+
+
+##################################################################
+#  Code below is associated with building session Recommender.   #
+##################################################################
+
+
+def _session_product_pairs(sessions_df: pd.DataFrame) -> pd.DataFrame:
+    # Each product is counted once per session, no matter how many times it was seen.
+    session_products = sessions_df[["session_id", "product_id"]].drop_duplicates()
+    pairs = session_products.merge(session_products, on="session_id", suffixes=("", "_neighbour"))
+    return pairs[pairs["product_id"] != pairs["product_id_neighbour"]]
+
+
+def _co_occurrence_counts(pairs: pd.DataFrame) -> pd.DataFrame:
+    return pairs.groupby(["product_id", "product_id_neighbour"]).size().reset_index(name="co_occurrences")
+
+
+def _top_neighbours(
+        co_occurrences: pd.DataFrame,
+        products_df: pd.DataFrame,
+        neighbours_count: int = NEIGHBOURS_COUNT
+        ) -> dict:
+    # Category of the neighbour decides in which list it will be served.
+    categories = products_df[["product_id", "category_path"]].rename(columns={"product_id": "product_id_neighbour"})
+    co_occurrences = co_occurrences.merge(categories, on="product_id_neighbour")
+    co_occurrences = co_occurrences.sort_values(
+        by=["co_occurrences", "product_id_neighbour"],
+        ascending=[False, True]
+    )
+    top = co_occurrences.groupby(["product_id", "category_path"]).head(neighbours_count)
+
+    neighbours = {}
+    for (product_id, category_path), group in top.groupby(["product_id", "category_path"], sort=False):
+        neighbours.setdefault(int(product_id), {})[category_path] = group["product_id_neighbour"].astype(int).to_list()
+    return neighbours
+
+
+def build(sessions_df: pd.DataFrame, products_df: pd.DataFrame) -> Recommender:
+    """
+    Builds session model (item-to-item co-occurrence index) from sessions and products DataFrames.
+
+    Sessions_df must contain columns named "session_id" and "product_id".
+    Products_df must contain columns named "product_id" and "category_path".
+
+    :param sessions_df: pd.DataFrame containing sessions information.
+    :param products_df: pd.DataFrame containing products information.
+    :return: session Recommender.
+    """
+    sessions_df = sessions_df.astype({"product_id": int})
+    pairs = _session_product_pairs(sessions_df)
+    co_occurrences = _co_occurrence_counts(pairs)
+    return Recommender(
+        neighbours=_top_neighbours(co_occurrences, products_df)
+    )
+
+
+if __name__ == "__main__":
+    productsDataPath = '../notebooks/data/v2/products.jsonl'
+    sessionsDataPath = '../notebooks/data/v2/sessions.jsonl'
+
+    sessionsDF = pd.read_json(sessionsDataPath, lines=True)
+    productsDF = pd.read_json(productsDataPath, lines=True)
+
+    sessionsDF, productsDF = preprocessors.preprocess_data_for_session_model(
+        sessions_df=sessionsDF,
+        products_df=productsDF
+    )
+
+    recommender = build(sessionsDF, productsDF)
+
+    print("Recommender constructed without error is read to use...")
+    print('Sample re-ranking for session which have seen product 1001 browsing "Gry na konsole"...')
+    print(recommender.rerank([], [1001], "Gry na konsole"))
+    recommender.dump(
+        neighbours_fp="session/co_occurrences.json"
+    )
+    restored_recommender = from_file(
+        neighbours_fp="session/co_occurrences.json"
+    )
+    print('\n')
+    print("Recommender read from file is ready to use...")
+    print('Sample re-ranking for session which have seen product 1001 browsing "Gry na konsole"...')
+    print(restored_recommender.rerank([], [1001], "Gry na konsole"))
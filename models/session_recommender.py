@@ -0,0 +1,97 @@
+import json
+
+"""
+    Serving part of the session model (see session.py for the way it is built).
+
+    Module depends only on the standard library, so it is cheap to import in the service.
+"""
+
+NEIGHBOURS_COUNT = 10
+# Only the most recent products are taken into account while re-ranking.
+# It keeps the per-request overhead constant.
+RECENT_ITEMS_COUNT = 5
+# Part of the list which can be taken by products co-occurring with recent items,
+# the rest of the list keeps ranking of the base recommender.
+MAX_BOOSTED_SHARE = 0.5
+
+
+class Recommender:
+
+    def __init__(self, neighbours: dict):
+        """
+        Constructs session recommender based on co-occurrence dictionary.
+
+        :param neighbours: dictionary containing mapping product_id -> category_path -> list of products.
+        """
+        self.neighbours = neighbours
+
+    def rerank(self, recommendations: list, recent_items: list, category: str) -> list:
+        """
+        Re-ranks recommendations with products co-occurring with recently seen ones.
+
+        Products co-occurring with recent items take at most MAX_BOOSTED_SHARE of the list,
+        the rest of it is filled with recommendations in their original order.
+        Recent items themselves are never recommended back to the user, slots freed by them
+        are filled with further co-occurring products (when there are any).
+        When there are no recommendations, list is made of co-occurring products only.
+
+        :param recommendations: list of products recommended by the base recommender.
+        :param recent_items: products seen in the current session (oldest first).
+        :param category: name of the currently browsing category.
+        :return: re-ranked list of products.
+        """
+        recent_items = recent_items[-RECENT_ITEMS_COUNT:]
+        seen = set(recent_items)
+        scores = {}
+        # Newer items and closer neighbours contribute more to the product score.
+        for recency, product_id in enumerate(reversed(recent_items)):
+            neighbours = self.neighbours.get(product_id, {}).get(category, [])
+            for rank, neighbour in enumerate(neighbours):
+                if neighbour not in seen:
+                    scores[neighbour] = scores.get(neighbour, 0.0) + 1.0 / ((recency + 1) * (rank + 1))
+
+        # Recent items are never recommended back to the user.
+        rest = [product_id for product_id in recommendations if product_id not in seen]
+        if not scores:
+            return rest
+
+        boosted = sorted(scores, key=scores.get, reverse=True)
+        if not recommendations:
+            return boosted[:NEIGHBOURS_COUNT]
+
+        boosted_count = int(len(recommendations) * MAX_BOOSTED_SHARE)
+        boosted_set = set(boosted[:boosted_count])
+        result = boosted[:boosted_count] + [product_id for product_id in rest if product_id not in boosted_set]
+        # Slots freed by recent items are filled with the next co-occurring products.
+        result += boosted[boosted_count:boosted_count + len(recommendations) - len(result)]
+        return result[:len(recommendations)]
+
+    def dump(self, neighbours_fp: str):
+        """
+        Saves session model into file.
+
+        :param neighbours_fp: file path to store neighbours dictionary in.
+        """
+        with open(neighbours_fp, 'w') as file:
+            json.dump(self.neighbours, file, sort_keys=True, indent=4)
+
+    @staticmethod
+    def name():
+        """
+        Function returns the name of the recommender.
+        """
+        return "Session"
+
+
+def from_file(neighbours_fp: str) -> Recommender:
+    """
+    Function restores session Recommender from file.
+
+    :param neighbours_fp: file containing neighbours for session Recommender (created with Recommender.dump())
+    :return: session Recommender constructed from data in file.
+    """
+    with open(neighbours_fp, 'r') as file:
+        neighbours = json.load(file)
+    return Recommender(
+        neighbours={int(key): value for key, value in neighbours.items()}
+    )
@@ -77,6 +77,27 @@ def preprocess_data_for_basic_model(
     )
 
 
+def preprocess_data_for_session_model(
+        sessions_df: pd.DataFrame,
+        products_df: pd.DataFrame
+        ) -> typing.Tuple[pd.DataFrame, pd.DataFrame]:
+    # Session model needs session_id to know which products were seen together,
+    # so this column is kept (in contrast to other models).
+    session_drop_columns = [
+        "timestamp",
+        "event_type",
+        "offered_discount",
+        "purchase_id",
+        "user_id"
+    ]
+    new_sessions = sessions_df.drop(columns=session_drop_columns)
+    new_sessions = new_sessions.dropna(subset=["session_id", "product_id"])
+    return (
+        new_sessions,
+        _preprocess_products_for_advanced_model(products_df=products_df)
+    )
+
+
 def preprocess_data_for_predictions(
         sessions_df: pd.DataFrame,
         products_df: pd.DataFrame) -> pd.DataFrame:
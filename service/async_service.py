@@ -0,0 +1,165 @@
+import time
+# Taken before other imports, so startup report includes their cost.
+started_at = time.perf_counter()
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+from aiohttp import web
+import startup_report
+from logger import AsyncLogger
+from session_store import SessionStore
+from serving import advanced_model, basic_model, rerank_for_session, to_int
+
+"""
+    Asyncio variant of the micro-service (see service.py).
+
+    Exposes the same "/" query contract (user_id, category_path, model and optional session_id)
+    and "/events" endpoint, but:
+        - model lookups are executed in the thread pool, so they never block the event loop,
+        - identical concurrent (model, group, category) lookups are coalesced into single computation,
+        - logging is performed by the background thread (AsyncLogger).
+"""
+
+logs_fp = "logs/logs.txt"
+
+HOST = "127.0.0.1"
+PORT = 8080
+
+
+class RequestCoalescer:
+    """
+    RequestCoalescer runs blocking function in the thread pool once per key.
+
+    Callers asking for the key, which is already being computed, await the same result.
+    """
+    def __init__(self):
+        self._in_flight = {}
+
+    async def run(self, key, func, *args):
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shield prevents single cancelled caller from cancelling computation shared with others.
+        return await asyncio.shield(future)
+
+
+def _query_args(request: web.Request) -> dict:
+    args = request.query
+    needed_keys = ["user_id", "category_path", "model"]
+    for key in needed_keys:
+        if key not in args:
+            raise RuntimeError("{} value is missing!".format(key))
+    return dict(args)
+
+
+def _send_response(request: web.Request, response: dict, code: int = 200) -> web.Response:
+    request.app["logger"].log(response)
+    return web.json_response(response, status=code)
+
+
+async def recommend(request: web.Request) -> web.Response:
+    response = {
+        "id": str(uuid4()),
+        "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    try:
+        query_param_dict = _query_args(request)
+        user_id = to_int(query_param_dict["user_id"], "user_id")
+        session_id = to_int(query_param_dict["session_id"], "session_id") \
+            if "session_id" in query_param_dict else None
+    except RuntimeError as err:
+        response["message"] = str(err)
+        return _send_response(request, response, 400)
+
+    response["user_id"] = user_id
+    response["model"] = query_param_dict["model"]
+    category = str(query_param_dict["category_path"])
+    coalescer = request.app["coalescer"]
+
+    try:
+        if query_param_dict["model"] == "advanced":
+            group_id = advanced_model.user_to_group[user_id]
+            recommendations = await coalescer.run(
+                ("advanced", group_id, category),
+                advanced_model.recommend_for_group,
+                group_id,
+                category
+            )
+            if session_id is not None:
+                response["session_id"] = session_id
+                recommendations = rerank_for_session(
+                    recommendations=recommendations,
+                    session_store=request.app["session_store"],
+                    session_id=session_id,
+                    category=category
+                )
+        elif query_param_dict["model"] == "basic":
+            # Basic recommendations are the same for every user and category.
+            recommendations = await coalescer.run(
+                ("basic", None, None),
+                basic_model.recommend,
+                user_id,
+                category
+            )
+        else:
+            response["message"] = "unknown model type!"
+            return _send_response(request, response, 400)
+    except KeyError:
+        response["message"] = "unknown user or category!"
+        return _send_response(request, response, 400)
+
+    response["recommendations"] = recommendations
+    return _send_response(request, response)
+
+
+async def session_events(request: web.Request) -> web.Response:
+    try:
+        event = await request.json()
+    except ValueError:
+        event = None
+    needed_keys = ["session_id", "product_id"]
+    if not isinstance(event, dict):
+        return web.json_response({"message": "event must be a json object!"}, status=400)
+    for key in needed_keys:
+        if key not in event:
+            return web.json_response({"message": "{} value is missing!".format(key)}, status=400)
+    try:
+        session_id = to_int(event["session_id"], "session_id")
+        product_id = to_int(event["product_id"], "product_id")
+    except RuntimeError as err:
+        return web.json_response({"message": str(err)}, status=400)
+
+    request.app["session_store"].add_event(
+        session_id=session_id,
+        product_id=product_id
+    )
+    return web.json_response({"session_id": session_id})
+
+
+async def _close_logger(app: web.Application):
+    # Writing remaining events blocks, so it is moved out of the event loop.
+    await asyncio.get_running_loop().run_in_executor(None, app["logger"].close)
+
+
+def create_app(logging_fp: str = logs_fp) -> web.Application:
+    """
+    Creates aiohttp application serving recommendations.
+
+    :param logging_fp: file path to store logs in.
+    :return: application ready to be run with aiohttp.web.run_app().
+    """
+    app = web.Application()
+    app["logger"] = AsyncLogger(logging_fp=logging_fp)
+    app["coalescer"] = RequestCoalescer()
+    app["session_store"] = SessionStore()
+    app.router.add_get('/', recommend)
+    app.router.add_post('/events', session_events)
+    app.on_cleanup.append(_close_logger)
+    startup_report.report(started_at)
+    return app
+
+
+if __name__ == '__main__':
+    web.run_app(create_app(), host=HOST, port=PORT)
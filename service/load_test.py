@@ -0,0 +1,119 @@
+import json
+import time
+import random
+import asyncio
+import argparse
+import statistics
+import aiohttp
+
+"""
+    Load test harness comparing the micro-service variants.
+
+    Sends the same randomly generated queries (user_id, category_path, model) to each of
+    the given service urls, keeping `concurrency` requests in flight, and reports
+    throughput together with the latency percentiles.
+
+    Usage (both services running):
+        python service.py                # Flask, http://127.0.0.1:5000/
+        python async_service.py          # asyncio, http://127.0.0.1:8080/
+        python load_test.py --url http://127.0.0.1:5000/ --url http://127.0.0.1:8080/
+"""
+
+advanced_user_to_group_fp = "../models/advanced/user_to_group.json"
+
+CATEGORIES = [
+    'Gry komputerowe',
+    'Gry na konsole',
+    'Sprzęt RTV',
+    'Komputery',
+    'Telefony i akcesoria'
+]
+
+
+def _generate_queries(requests_count: int, model: str, seed: int) -> list:
+    with open(advanced_user_to_group_fp, 'r') as file:
+        user_ids = list(json.load(file).keys())
+    generator = random.Random(seed)
+    return [
+        {
+            "user_id": generator.choice(user_ids),
+            "category_path": generator.choice(CATEGORIES),
+            "model": model
+        }
+        for _ in range(requests_count)
+    ]
+
+
+def _percentile(sorted_values: list, percent: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def _run_load(url: str, queries: list, concurrency: int) -> dict:
+    latencies, errors = [], 0
+    queue = asyncio.Queue()
+    for query in queries:
+        queue.put_nowait(query)
+
+    async def worker(session: aiohttp.ClientSession):
+        nonlocal errors
+        while not queue.empty():
+            query = queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                async with session.get(url, params=query) as response:
+                    await response.read()
+                    if response.status != 200:
+                        errors += 1
+            except aiohttp.ClientError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "url": url,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000
+    }
+
+
+def _print_report(results: list):
+    header = "{:<32} {:>8} {:>7} {:>10} {:>9} {:>9} {:>9} {:>9} {:>9}"
+    row = "{:<32} {:>8} {:>7} {:>10.1f} {:>9.2f} {:>9.2f} {:>9.2f} {:>9.2f} {:>9.2f}"
+    print(header.format("url", "requests", "errors", "req/s", "mean ms", "p50 ms", "p95 ms", "p99 ms", "max ms"))
+    for result in results:
+        print(row.format(*result.values()))
+
+
+async def main(urls: list, requests_count: int, concurrency: int, model: str, seed: int):
+    queries = _generate_queries(requests_count, model, seed)
+    results = []
+    for url in urls:
+        # Short warm-up, so connection setup and lazy initialization do not distort results.
+        await _run_load(url, queries[:concurrency], concurrency)
+        results.append(await _run_load(url, queries, concurrency))
+    _print_report(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compares throughput and latency of the service variants.")
+    parser.add_argument("--url", action="append", required=True, help="service url, may be given multiple times")
+    parser.add_argument("--requests", type=int, default=10000, help="amount of requests sent to each service")
+    parser.add_argument("--concurrency", type=int, default=50, help="amount of requests in flight")
+    parser.add_argument("--model", default="advanced", choices=["advanced", "basic"])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.url, args.requests, args.concurrency, args.model, args.seed))
@@ -0,0 +1,198 @@
+import os
+import glob
+import json
+import time
+import typing
+import argparse
+from datetime import datetime
+import pandas as pd
+
+"""
+    Log rotation and compaction tool.
+
+    Rotation moves the current logging file aside (logs.txt -> logs-<rotation time>.txt).
+    Running services notice that and start writing to the new logs.txt (see Logger).
+
+    Compaction converts rotated logging files into columnar (parquet) files,
+    partitioned by the day of the event:
+        <compacted_dir>/day=YYYY-MM-DD/<rotated file name>.parquet
+    Rotated file is removed after it has been compacted. Compacting the same file again
+    overwrites its parts, so interrupted compaction can be safely repeated.
+    Undecodable records are skipped and counted, file which fails to compact
+    is left for the next run.
+
+    Compacted logs can be read with log_reader.py.
+"""
+
+logs_fp = "logs/logs.txt"
+compacted_dir = "logs/compacted"
+
+# Rotated files modified within this period may still receive events
+# from the services which did not notice rotation yet.
+ROTATION_GRACE_PERIOD = 5
+
+READ_CHUNK_SIZE = 1 << 20
+
+COLUMNS = [
+    "id",
+    "date",
+    "user_id",
+    "model",
+    "session_id",
+    "message",
+    "recommendations"
+]
+
+INTEGER_COLUMNS = [
+    "user_id",
+    "session_id"
+]
+
+# Ids are converted through floating point numbers, so only ids exactly representable
+# as those are accepted (the same limit is used by the services, see serving.py).
+MAX_ID = 2 ** 53 - 1
+
+
+def _rotated_files_pattern(logging_fp: str) -> str:
+    root, extension = os.path.splitext(logging_fp)
+    return "{}-*{}".format(root, extension)
+
+
+def rotate(logging_fp: str = logs_fp) -> str:
+    """
+    Moves current logging file aside.
+
+    :param logging_fp: file path of the logging file used by the services.
+    :return: file path of the rotated file, None if there was nothing to rotate.
+    """
+    if not os.path.exists(logging_fp) or os.path.getsize(logging_fp) == 0:
+        return None
+    root, extension = os.path.splitext(logging_fp)
+    rotated_fp = "{}-{}{}".format(root, datetime.now().strftime('%Y%m%d%H%M%S%f'), extension)
+    os.rename(logging_fp, rotated_fp)
+    return rotated_fp
+
+
+def _read_events(fp: str):
+    # Decoder is used instead of reading line by line, so files written
+    # by the older Logger (multi-line, indented json objects) are read as well.
+    # Undecodable records (ex. truncated, when the service died while writing) are
+    # yielded as None. Reading resumes from the next line starting with "{",
+    # which is the beginning of the next event in both formats.
+    decoder = json.JSONDecoder()
+    buffer = ""
+    with open(fp, 'r') as file:
+        while True:
+            chunk = file.read(READ_CHUNK_SIZE)
+            buffer += chunk
+            position = 0
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                if position == len(buffer):
+                    break
+                try:
+                    event, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    next_event = buffer.find("\n{", position)
+                    if next_event != -1:
+                        yield None
+                        position = next_event + 1
+                        continue
+                    if chunk:
+                        # Event may be split between chunks, rest of it will be read with the next chunk.
+                        break
+                    yield None
+                    return
+                yield event if isinstance(event, dict) else None
+            buffer = buffer[position:]
+            if not chunk:
+                return
+
+
+def _events_to_df(events: list) -> typing.Tuple[pd.DataFrame, int]:
+    events_df = pd.DataFrame.from_records(events, columns=COLUMNS)
+    events_df["date"] = pd.to_datetime(events_df["date"], format='%Y-%m-%d %H:%M:%S', errors="coerce")
+    invalid = events_df["date"].isna()
+    for column in INTEGER_COLUMNS:
+        numbers = pd.to_numeric(events_df[column], errors="coerce")
+        # Values which are not integers or are out of range (ex. huge user_id) make the event invalid.
+        valid_numbers = (numbers.abs() <= MAX_ID) & (numbers % 1 == 0)
+        invalid |= events_df[column].notna() & ~valid_numbers
+        events_df[column] = numbers.where(valid_numbers)
+    events_df = events_df[~invalid].astype({
+        "id": "string",
+        "user_id": "Int64",
+        "model": "category",
+        "session_id": "Int64",
+        "message": "string"
+    })
+    return events_df, int(invalid.sum())
+
+
+def compact_file(fp: str, output_dir: str = compacted_dir) -> int:
+    """
+    Converts single rotated logging file into parquet files partitioned by day.
+
+    Records which can not be decoded (or have no valid date or ids) are skipped and counted.
+
+    :param fp: file path of the rotated logging file.
+    :param output_dir: directory to store compacted logs in.
+    :return: amount of events compacted.
+    """
+    events, skipped = [], 0
+    for event in _read_events(fp):
+        if event is None:
+            skipped += 1
+        else:
+            events.append(event)
+    events_df, invalid_count = _events_to_df(events)
+    skipped += invalid_count
+
+    part_name = os.path.splitext(os.path.basename(fp))[0] + ".parquet"
+    for day, day_df in events_df.groupby(events_df["date"].dt.strftime('%Y-%m-%d')):
+        partition_dir = os.path.join(output_dir, "day={}".format(day))
+        os.makedirs(partition_dir, exist_ok=True)
+        day_df.to_parquet(os.path.join(partition_dir, part_name), index=False)
+    os.remove(fp)
+    if skipped:
+        print("Skipped {} undecodable events in {}...".format(skipped, fp))
+    return events_df.shape[0]
+
+
+def compact(
+        logging_fp: str = logs_fp,
+        output_dir: str = compacted_dir,
+        grace_period: float = ROTATION_GRACE_PERIOD
+        ) -> int:
+    """
+    Compacts all rotated logging files, which are no longer written to.
+
+    :param logging_fp: file path of the logging file used by the services.
+    :param output_dir: directory to store compacted logs in.
+    :param grace_period: files modified within this amount of seconds are left for the next run.
+    :return: amount of events compacted.
+    """
+    events_count = 0
+    for fp in sorted(glob.glob(_rotated_files_pattern(logging_fp))):
+        if time.time() - os.path.getmtime(fp) < grace_period:
+            continue
+        # Single broken file is left for the next run, other files are still compacted.
+        try:
+            events_count += compact_file(fp, output_dir)
+        except Exception as err:
+            print("Failed to compact {}: {}".format(fp, err))
+    return events_count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Rotates service logs and compacts them into parquet files.")
+    parser.add_argument("--logs", default=logs_fp, help="logging file used by the services")
+    parser.add_argument("--output", default=compacted_dir, help="directory to store compacted logs in")
+    parser.add_argument("--no-rotate", action="store_true", help="only compact already rotated files")
+    args = parser.parse_args()
+
+    if not args.no_rotate and rotate(args.logs) is not None:
+        # Gives the services time to notice rotation before the rotated file is compacted.
+        time.sleep(ROTATION_GRACE_PERIOD)
+    print("Compacted {} events...".format(compact(args.logs, args.output)))
@@ -0,0 +1,81 @@
+import os
+import glob
+from datetime import date
+import pandas as pd
+from log_compactor import compacted_dir
+
+"""
+    Reader of the compacted service logs (see log_compactor.py).
+
+    Only partitions (days) within requested date range are opened and only
+    requested columns are read from parquet files, so analysis of long periods
+    does not require parsing whole logs.
+"""
+
+PARTITION_PREFIX = "day="
+
+
+def _partitions(logs_dir: str, start: date = None, end: date = None) -> list:
+    partitions = []
+    for partition_dir in sorted(glob.glob(os.path.join(logs_dir, PARTITION_PREFIX + "*"))):
+        day = date.fromisoformat(os.path.basename(partition_dir)[len(PARTITION_PREFIX):])
+        if (start is None or start <= day) and (end is None or day <= end):
+            partitions.append(partition_dir)
+    return partitions
+
+
+def read_logs(
+        logs_dir: str = compacted_dir,
+        columns: list = None,
+        start: date = None,
+        end: date = None
+        ) -> pd.DataFrame:
+    """
+    Reads compacted logs.
+
+    :param logs_dir: directory containing compacted logs.
+    :param columns: names of the columns to read (all columns if not specified).
+    :param start: first day to read (inclusive), no lower bound if not specified.
+    :param end: last day to read (inclusive), no upper bound if not specified.
+    :return: pd.DataFrame with requested log events.
+    """
+    parts = [
+        pd.read_parquet(fp, columns=columns)
+        for partition_dir in _partitions(logs_dir, start, end)
+        for fp in sorted(glob.glob(os.path.join(partition_dir, "*.parquet")))
+    ]
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(parts, ignore_index=True)
+
+
+def models_summary(
+        logs_dir: str = compacted_dir,
+        start: date = None,
+        end: date = None
+        ) -> pd.DataFrame:
+    """
+    Summarizes A/B test of the models served within given date range.
+
+    Summary contains (for each model) amount of requests, amount of failed requests,
+    amount of distinct users served and coverage (amount of distinct products recommended).
+
+    :param logs_dir: directory containing compacted logs.
+    :param start: first day to summarize (inclusive).
+    :param end: last day to summarize (inclusive).
+    :return: pd.DataFrame indexed by model name.
+    """
+    logs_df = read_logs(logs_dir, ["model", "user_id", "message", "recommendations"], start, end)
+    logs_df = logs_df.dropna(subset=["model"])
+    summary = logs_df.groupby("model", observed=True).agg(
+        requests=("user_id", "size"),
+        errors=("message", "count"),
+        users=("user_id", "nunique")
+    )
+    recommended = logs_df.dropna(subset=["recommendations"]).explode("recommendations")
+    summary["coverage"] = recommended.groupby("model", observed=True)["recommendations"].nunique()
+    return summary.fillna({"coverage": 0}).astype({"coverage": int})
+
+
+if __name__ == '__main__':
+    print(models_summary())
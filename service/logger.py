@@ -1,15 +1,119 @@
+import os
 import json
+import time
+import queue
+import threading
+
+# Rotation of the logging file is checked at most once per this amount of seconds.
+# It has to be shorter than the grace period of the compaction (see log_compactor.py).
+ROTATION_CHECK_INTERVAL = 1.0
 
 
 class Logger:
     """
     Logger class allows to store events (in .json form) to logging files.
+
+    Each event is written as a single line (JSON Lines format).
+    When the logging file is rotated (moved away, see log_compactor.py),
+    Logger reopens it within ROTATION_CHECK_INTERVAL seconds.
+    Logger can be used by many threads at once.
     """
+    # Line buffering makes each event reach the file right after being logged,
+    # so events are not lost (nor left in memory) when the file is rotated and compacted
+    # while the service is idle.
+    BUFFERING = 1
+
     def __init__(self, logging_fp):
-        self.log_file = open(logging_fp, "a")
+        self.logging_fp = logging_fp
+        # Guards the file, as it may be reopened by one thread while another one writes to it.
+        self._lock = threading.Lock()
+        self._open()
 
     def __del__(self):
         self.log_file.close()
 
     def log(self, json_data):
-        self.log_file.write(json.dumps(json_data, indent=4) + '\n')
+        line = json.dumps(json_data) + '\n'
+        with self._lock:
+            self._reopen_if_rotated()
+            self.log_file.write(line)
+
+    def _open(self):
+        self.log_file = open(self.logging_fp, "a", buffering=self.BUFFERING)
+        stat = os.fstat(self.log_file.fileno())
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._last_rotation_check = time.monotonic()
+
+    def _reopen_if_rotated(self):
+        now = time.monotonic()
+        if now - self._last_rotation_check < ROTATION_CHECK_INTERVAL:
+            return
+        self._last_rotation_check = now
+        try:
+            stat = os.stat(self.logging_fp)
+            rotated = (stat.st_dev, stat.st_ino) != self._file_id
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            self.log_file.close()
+            self._open()
+
+
+class AsyncLogger(Logger):
+    """
+    AsyncLogger stores events the same way as Logger, but never blocks the caller.
+
+    Events are put into a bounded queue and written to the file by a background thread,
+    which flushes the file only when there is nothing more to write (writes are batched).
+    When the queue is full (writer can not keep up), events are dropped and counted.
+    Amount of dropped events is reported when the logger is closed.
+    Events logged after closing are written synchronously.
+    """
+    BUFFERING = -1
+
+    def __init__(self, logging_fp, max_queue_size: int = 10000):
+        super().__init__(logging_fp)
+        self.dropped = 0
+        self._closed = False
+        # Guards against queueing events after the background thread was asked to stop.
+        self._close_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def log(self, json_data):
+        with self._close_lock:
+            if not self._closed:
+                try:
+                    self._queue.put_nowait(json_data)
+                except queue.Full:
+                    self.dropped += 1
+                return
+        super().log(json_data)
+        self._flush()
+
+    def close(self):
+        """
+        Writes all queued events, stops the background thread and reports dropped events.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        self._flush()
+        print("Logger closed, {} events dropped because of full queue".format(self.dropped))
+
+    def _write_loop(self):
+        while True:
+            json_data = self._queue.get()
+            if json_data is None:
+                break
+            super().log(json_data)
+            if self._queue.empty():
+                self._flush()
+
+    def _flush(self):
+        with self._lock:
+            self.log_file.flush()
@@ -1,33 +1,18 @@
+import time
+# Taken before other imports, so startup report includes their cost.
+started_at = time.perf_counter()
 from flask import Flask, request
 from flask_restful import Resource, Api
 from datetime import datetime
 from uuid import uuid4
+import startup_report
 from logger import Logger
-from models.advanced import from_files as advanced_from_files
-from models.basic import from_file as basic_from_file
-
-basic_recommender_fp = "../models/basic/recommendations.json"
-
-advanced_user_to_group_fp = "../models/advanced/user_to_group.json"
-advanced_group_recommendations_fp = "../models/advanced/group_recommendations.json"
+from session_store import SessionStore
+from serving import advanced_model, basic_model, rerank_for_session, to_int
 
 logs_fp = "logs/logs.txt"
 
-############################################################################
-# NOTE                                                                     #
-# Models should be already created before running the service.             #
-# Code will crash, if files specified in paths above (ending with _fp)     #
-# do not exist or are corrupted!                                           #
-############################################################################
-
-advanced_model = advanced_from_files(
-    user_to_group_fp=advanced_user_to_group_fp,
-    group_recommendations_fp=advanced_group_recommendations_fp
-)
-
-basic_model = basic_from_file(
-    recommendations_fp=basic_recommender_fp
-)
+session_store = SessionStore()
 
 logger = Logger(logging_fp=logs_fp)
 
@@ -45,25 +30,40 @@ class Recommender(Resource):
         }
         try:
             query_param_dict = Recommender.__query_args()
+            user_id = to_int(query_param_dict["user_id"], "user_id")
+            session_id = to_int(query_param_dict["session_id"], "session_id") \
+                if "session_id" in query_param_dict else None
         except RuntimeError as err:
             response["message"] = str(err)
             return Recommender.__send_response(response, 400)
 
-        response["user_id"] = int(query_param_dict["user_id"])
+        response["user_id"] = user_id
         response["model"] = query_param_dict["model"]
 
-        if query_param_dict["model"] == "advanced":
-            recommendations = advanced_model.recommend(
-                user_id=int(query_param_dict["user_id"]),
-                category=str(query_param_dict["category_path"])
-            )
-        elif query_param_dict["model"] == "basic":
-            recommendations = basic_model.recommend(
-                user_id=int(query_param_dict["user_id"]),
-                category=str(query_param_dict["category_path"])
-            )
-        else:
-            response["message"] = "unknown model type!"
+        try:
+            if query_param_dict["model"] == "advanced":
+                recommendations = advanced_model.recommend(
+                    user_id=user_id,
+                    category=str(query_param_dict["category_path"])
+                )
+                if session_id is not None:
+                    response["session_id"] = session_id
+                    recommendations = rerank_for_session(
+                        recommendations=recommendations,
+                        session_store=session_store,
+                        session_id=session_id,
+                        category=str(query_param_dict["category_path"])
+                    )
+            elif query_param_dict["model"] == "basic":
+                recommendations = basic_model.recommend(
+                    user_id=user_id,
+                    category=str(query_param_dict["category_path"])
+                )
+            else:
+                response["message"] = "unknown model type!"
+                return Recommender.__send_response(response, 400)
+        except KeyError:
+            response["message"] = "unknown user or category!"
             return Recommender.__send_response(response, 400)
 
         response["recommendations"] = recommendations
@@ -84,7 +84,33 @@ class Recommender(Resource):
         return response, code
 
 
+class SessionEvents(Resource):
+    @staticmethod
+    def post():
+        event = request.get_json(silent=True)
+        needed_keys = ["session_id", "product_id"]
+        if not isinstance(event, dict):
+            return {"message": "event must be a json object!"}, 400
+        for key in needed_keys:
+            if key not in event:
+                return {"message": "{} value is missing!".format(key)}, 400
+        try:
+            session_id = to_int(event["session_id"], "session_id")
+            product_id = to_int(event["product_id"], "product_id")
+        except RuntimeError as err:
+            return {"message": str(err)}, 400
+
+        session_store.add_event(
+            session_id=session_id,
+            product_id=product_id
+        )
+        return {"session_id": session_id}, 200
+
+
 api.add_resource(Recommender, '/')
+api.add_resource(SessionEvents, '/events')
+
+startup_report.report(started_at)
 
 if __name__ == '__main__':
     app.run()
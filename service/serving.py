@@ -0,0 +1,86 @@
+import os
+from session_store import SessionStore
+from models.advanced_recommender import from_files as advanced_from_files
+from models.basic_recommender import from_file as basic_from_file
+from models.session_recommender import from_file as session_from_file
+from models.session_recommender import Recommender as SessionRecommender
+
+"""
+    Models and session state shared by both variants of the micro-service
+    (service.py and async_service.py).
+"""
+
+basic_recommender_fp = "../models/basic/recommendations.json"
+
+advanced_user_to_group_fp = "../models/advanced/user_to_group.json"
+advanced_group_recommendations_fp = "../models/advanced/group_recommendations.json"
+
+session_neighbours_fp = "../models/session/co_occurrences.json"
+
+# Ids received from the clients are logged and later compacted (see log_compactor.py),
+# which accepts only ids exactly representable as floating point numbers.
+MAX_ID = 2 ** 53 - 1
+
+############################################################################
+# NOTE                                                                     #
+# Models should be already created before running the service.             #
+# Code will crash, if files specified in paths above (ending with _fp)     #
+# do not exist or are corrupted!                                           #
+############################################################################
+
+advanced_model = advanced_from_files(
+    user_to_group_fp=advanced_user_to_group_fp,
+    group_recommendations_fp=advanced_group_recommendations_fp
+)
+
+basic_model = basic_from_file(
+    recommendations_fp=basic_recommender_fp
+)
+
+# Session model is optional, without it recommendations are not re-ranked.
+if os.path.exists(session_neighbours_fp):
+    session_model = session_from_file(neighbours_fp=session_neighbours_fp)
+else:
+    session_model = SessionRecommender(neighbours={})
+    print("WARNING: {} not found, recommendations will not be re-ranked for sessions. "
+          "Build the index with models/session.py (see README).".format(session_neighbours_fp))
+
+
+def to_int(value, name: str) -> int:
+    """
+    Converts value received from the client into integer.
+
+    :param value: value to convert.
+    :param name: name of the value, used in the error message.
+    :return: converted value.
+    :raises RuntimeError: when value is not an integer or its absolute value exceeds MAX_ID.
+    """
+    try:
+        number = int(value)
+    except (ValueError, TypeError):
+        raise RuntimeError("{} must be an integer!".format(name))
+    if abs(number) > MAX_ID:
+        raise RuntimeError("{} is out of range!".format(name))
+    return number
+
+
+def rerank_for_session(
+        recommendations: list,
+        session_store: SessionStore,
+        session_id: int,
+        category: str
+        ) -> list:
+    """
+    Re-ranks recommendations with products recently seen in the session.
+
+    :param recommendations: list of products recommended by the base recommender.
+    :param session_store: store keeping products recently seen in the sessions.
+    :param session_id: id of the session the request belongs to.
+    :param category: name of the currently browsing category.
+    :return: re-ranked list of products.
+    """
+    return session_model.rerank(
+        recommendations=recommendations,
+        recent_items=session_store.recent_items(session_id),
+        category=category
+    )
@@ -0,0 +1,68 @@
+import time
+import random
+import argparse
+from session_store import SessionStore
+from models.session_recommender import NEIGHBOURS_COUNT, Recommender as SessionRecommender
+from serving import advanced_model, session_model
+
+"""
+    Benchmark of the per-request overhead of session-aware recommendations.
+
+    Measures the work added to the advanced model request by the session model:
+    storing the session event (SessionStore.add_event) and re-ranking the group list
+    (Recommender.rerank). When the co-occurrence index was not built, synthetic index
+    with NEIGHBOURS_COUNT neighbours for every product and category is used.
+
+    Usage:
+        python session_benchmark.py --requests 100000
+"""
+
+
+def _synthetic_model(products: list, categories: list, generator: random.Random) -> SessionRecommender:
+    return SessionRecommender(neighbours={
+        product_id: {category: generator.sample(products, NEIGHBOURS_COUNT) for category in categories}
+        for product_id in products
+    })
+
+
+def main(requests_count: int, sessions_count: int, seed: int):
+    generator = random.Random(seed)
+    group_lists = advanced_model.group_recommendations
+    categories = sorted({category for group in group_lists.values() for category in group})
+    products = sorted({product_id for group in group_lists.values() for recommended in group.values()
+                       for product_id in recommended})
+    model = session_model if session_model.neighbours else _synthetic_model(products, categories, generator)
+    store = SessionStore()
+    user_ids = list(advanced_model.user_to_group.keys())
+
+    latencies = []
+    for _ in range(requests_count):
+        session_id = generator.randrange(sessions_count)
+        user_id = generator.choice(user_ids)
+        category = generator.choice(categories)
+        recommendations = advanced_model.recommend(user_id, category)
+
+        start = time.perf_counter()
+        store.add_event(session_id, generator.choice(products))
+        model.rerank(recommendations, store.recent_items(session_id), category)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    print("Session overhead per request ({} requests, {} sessions, {} index):".format(
+        requests_count, sessions_count, "built" if model is session_model else "synthetic"))
+    print("mean: {:.1f} us, p50: {:.1f} us, p99: {:.1f} us, max: {:.1f} us".format(
+        sum(latencies) / len(latencies) * 1e6,
+        latencies[len(latencies) // 2] * 1e6,
+        latencies[int(len(latencies) * 0.99)] * 1e6,
+        latencies[-1] * 1e6
+    ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measures per-request overhead of the session model.")
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.requests, args.sessions, args.seed)
@@ -0,0 +1,67 @@
+import time
+import threading
+from collections import OrderedDict, deque
+
+
+class SessionStore:
+    """
+    SessionStore keeps products recently seen within each active session.
+
+    State is bounded in both dimensions:
+        - each session stores at most max_items most recent products,
+        - at most max_sessions sessions are stored, least recently used are evicted first,
+        - sessions without any event for ttl seconds are evicted.
+    """
+    def __init__(self, max_sessions: int = 100000, max_items: int = 10, ttl: float = 30 * 60):
+        self.max_sessions = max_sessions
+        self.max_items = max_items
+        self.ttl = ttl
+        # Mapping session_id -> (last_event_time, deque of product_ids), ordered from least recently used.
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_event(self, session_id: int, product_id: int):
+        """
+        Stores product seen in the session and marks the session as recently used.
+
+        :param session_id: id of the session the event belongs to.
+        :param product_id: id of the product user had interaction with.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            items = entry[1] if entry is not None else deque(maxlen=self.max_items)
+            # Repeated product is moved to the end instead of being stored twice.
+            if product_id in items:
+                items.remove(product_id)
+            items.append(product_id)
+            self._sessions[session_id] = (now, items)
+            self._evict(now)
+
+    def recent_items(self, session_id: int) -> list:
+        """
+        Returns products recently seen in the session.
+
+        :param session_id: id of the session.
+        :return: list of product_ids (oldest first), empty if session is unknown or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return []
+            if now - entry[0] > self.ttl:
+                del self._sessions[session_id]
+                return []
+            return list(entry[1])
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _evict(self, now: float):
+        # Sessions are ordered by last event time, so expired ones are always at the front.
+        while self._sessions:
+            session_id, (last_event_time, _) = next(iter(self._sessions.items()))
+            if len(self._sessions) <= self.max_sessions and now - last_event_time <= self.ttl:
+                break
+            del self._sessions[session_id]
@@ -0,0 +1,50 @@
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Module is not available on Windows, memory is not reported there.
+    resource = None
+
+"""
+    Reporting of the service startup cost (time and memory).
+
+    Time is measured from the moment given by the caller (ideally the first line of the service).
+    Memory is the peak resident set size of the process.
+    Heavy modules, which should never be imported while serving, are listed as well.
+"""
+
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "sklearn"
+]
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+
+def report(started_at: float) -> dict:
+    """
+    Prints and returns the service startup report.
+
+    :param started_at: time.perf_counter() value taken when the service started.
+    :return: dictionary with startup time (s), peak memory (MB) and heavy modules imported.
+    """
+    startup_report = {
+        "startup_time_s": round(time.perf_counter() - started_at, 3),
+        "peak_rss_mb": _peak_rss_mb(),
+        "heavy_modules": [module for module in HEAVY_MODULES if module in sys.modules]
+    }
+    print("Service started in {:.3f} s, peak memory: {} MB, heavy modules imported: {}".format(
+        startup_report["startup_time_s"],
+        "unknown" if startup_report["peak_rss_mb"] is None else round(startup_report["peak_rss_mb"], 1),
+        startup_report["heavy_modules"] or "none"
+    ))
+    return startup_report